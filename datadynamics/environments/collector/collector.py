@@ -7,7 +7,8 @@ import pygame
 from pettingzoo.utils import agent_selector
 from pettingzoo.utils.env import AECEnv
 
-from datadynamics.utils.objects import Collector, Point
+from datadynamics.utils.objects import Collector, Point, colorpicker
+from datadynamics.utils.observations import LazyImageDict
 
 FPS = 120
 SCREEN_WIDTH = 1000
@@ -64,6 +65,7 @@ class raw_env(AECEnv):
         collection_reward=lambda point: 100,
         reveal_cheating_cost=True,
         reveal_collection_reward=True,
+        cache_distances=True,
         seed=None,
         render_mode=None,
     ):
@@ -90,6 +92,10 @@ class raw_env(AECEnv):
             reveal_collection_reward (bool, optional): Whether to reveal the
                 collection rewards to the agent in observations. Defaults to
                 True.
+            cache_distances (bool, optional): Whether to precompute all
+                pairwise point distances s.t. rewards in step() become O(1)
+                lookups. Requires O(n_points^2) memory, so disable for very
+                large point sets. Defaults to True.
             seed (int, optional): Seed for random number generator. Defaults
                 to None.
             render_mode (str, optional): Render mode. Supported modes are
@@ -115,6 +121,36 @@ class raw_env(AECEnv):
 
         self.reward_range = (-np.inf, 0)
 
+        self._n_points = len(self.point_positions)
+
+        self.cache_distances = cache_distances
+        if cache_distances:
+            # Point and initial agent positions never change, so all
+            # distances needed by reward() can be computed up front.
+            point_positions_arr = np.asarray(
+                self.point_positions, dtype=np.float64
+            )
+            agent_positions_arr = np.asarray(
+                self.agent_positions, dtype=np.float64
+            )
+            point_diff = (
+                point_positions_arr[:, None, :]
+                - point_positions_arr[None, :, :]
+            )
+            self._point_distances = np.hypot(
+                point_diff[..., 0], point_diff[..., 1]
+            )
+            agent_diff = (
+                agent_positions_arr[:, None, :]
+                - point_positions_arr[None, :, :]
+            )
+            self._init_distances = np.hypot(
+                agent_diff[..., 0], agent_diff[..., 1]
+            )
+        else:
+            self._point_distances = None
+            self._init_distances = None
+
         self.agents = [f"agent_{i}" for i in range(len(self.agent_positions))]
         self.possible_agents = self.agents[:]
         self.agent_name_mapping = {
@@ -125,9 +161,20 @@ class raw_env(AECEnv):
             agent: max_collect[i] for i, agent in enumerate(self.agents)
         }
 
+        # Compute position extrema once and share them between scaling and
+        # space construction instead of re-reducing the concatenated
+        # positions for every consumer.
+        all_positions = np.concatenate(
+            (self.agent_positions, self.point_positions)
+        )
+        self._position_min = np.min(all_positions, axis=0)
+        self._position_max = np.max(all_positions, axis=0)
+        self._point_min = np.min(self.point_positions, axis=0)
+        self._point_max = np.max(self.point_positions, axis=0)
+
         self.scaling, self.translation = self._get_scaling_translation(
-            self.point_positions,
-            self.agent_positions,
+            self._position_min,
+            self._position_max,
             SCREEN_WIDTH,
             SCREEN_HEIGHT,
         )
@@ -167,28 +214,45 @@ class raw_env(AECEnv):
         self.infos = None
         self.collectors = None
         self.cumulative_rewards = None
+        # Cached state arrays, updated incrementally in step().
+        self._point_positions_arr = None
+        self._collected_arr = None
+        self._collector_positions_arr = None
+        self._cheating_cost_arr = None
+        self._collection_reward_arr = None
+        self._point_scaled_positions = None
 
         # pygame
         self.screen = None
         self.clock = None
         self.surf = None
+        self._bg_surf = None
+        self._rgb_out = None
+        self._font = None
+        self._point_sprite = None
+        # Dirty rectangles for partial display updates in human mode.
+        self._dirty_rects = []
+        self._prev_dirty_rects = None
         self.isopen = False
 
-    def _get_boundary_arrays(self, array_2d, shape):
-        """Creates arrays with minimum and maximum with same shape as input.
+    def _get_boundary_arrays(self, minimum, maximum, shape):
+        """Creates arrays from precomputed minimum and maximum boundaries.
 
         Args:
-            array_2d (np.ndarray): Input array to find minimum and maximum.
+            minimum (np.ndarray): Precomputed minimum along each axis.
+            maximum (np.ndarray): Precomputed maximum along each axis.
             shape (_type_): Tuple with shape of output arrays.
 
         Returns:
             np.ndarray: Boundary arrays with minimum and maximum.
         """
-        boundary_low = np.full(
-            shape, np.min(array_2d, axis=0), dtype=np.float64
+        # The arrays only describe Box bounds and are never written to, so
+        # zero-copy broadcast views are sufficient.
+        boundary_low = np.broadcast_to(
+            np.asarray(minimum, dtype=np.float64), shape
         )
-        boundary_high = np.full(
-            shape, np.max(array_2d, axis=0), dtype=np.float64
+        boundary_high = np.broadcast_to(
+            np.asarray(maximum, dtype=np.float64), shape
         )
         return boundary_low, boundary_high
 
@@ -217,10 +281,11 @@ class raw_env(AECEnv):
         """
         n_points = point_positions.shape[0]
         point_boundary_low, point_boundary_high = self._get_boundary_arrays(
-            point_positions, shape=(n_points, 2)
+            self._point_min, self._point_max, shape=(n_points, 2)
         )
         boundary_low, boundary_high = self._get_boundary_arrays(
-            np.concatenate((agent_positions, point_positions)),
+            self._position_min,
+            self._position_max,
             shape=(len(agent_positions), 2),
         )
 
@@ -231,7 +296,7 @@ class raw_env(AECEnv):
                 dtype=np.float64,
             ),
             "collected": gymnasium.spaces.Box(
-                low=0, high=np.inf, shape=(n_points,), dtype=int
+                low=0, high=np.inf, shape=(n_points,), dtype=np.int32
             ),
             "collector_positions": gymnasium.spaces.Box(
                 low=boundary_low, high=boundary_high, dtype=np.float64
@@ -269,9 +334,11 @@ class raw_env(AECEnv):
         Returns:
             dict: Dictionary of discrete action spaces.
         """
-        action_spaces = {
-            agent: gymnasium.spaces.Discrete(n_points) for agent in agents
-        }
+        # The spaces are identical for all agents, so a single shared space
+        # object avoids allocating one per agent.
+        action_spaces = dict.fromkeys(
+            agents, gymnasium.spaces.Discrete(n_points)
+        )
         return action_spaces
 
     def _get_observation_spaces(
@@ -305,17 +372,18 @@ class raw_env(AECEnv):
         Returns:
             dict: Dictionary of observation spaces keyed by agent name.
         """
-        observation_spaces = {
-            agent: self._get_obs_state_space(
+        # Since the spaces are identical, all agents share one space object.
+        observation_spaces = dict.fromkeys(
+            agents,
+            self._get_obs_state_space(
                 agent_positions,
                 point_positions,
                 reveal_cheating_cost,
                 reveal_collection_reward,
                 screen_width,
                 screen_height,
-            )
-            for agent in agents
-        }
+            ),
+        )
         return observation_spaces
 
     def _get_state_space(
@@ -344,8 +412,8 @@ class raw_env(AECEnv):
 
     def _get_scaling_translation(
         self,
-        point_positions,
-        agent_positions,
+        minimum,
+        maximum,
         screen_width,
         screen_height,
         relative_padding=0.1,
@@ -355,8 +423,10 @@ class raw_env(AECEnv):
         Fits data on display while preserving aspect ratio.
 
         Args:
-            point_positions (np.ndarray): Point positions.
-            agent_positions (np.ndarray): Agent positions.
+            minimum (np.ndarray): Precomputed minimum of all positions along
+                each axis.
+            maximum (np.ndarray): Precomputed maximum of all positions along
+                each axis.
             screen_width (int): Width of display screen.
             screen_height (int): Height of display screen.
             relative_padding (float, optional): Outside padding.
@@ -367,9 +437,6 @@ class raw_env(AECEnv):
                 ((scale_x, scale_y), (translate_x, translate_y)).
         """
         assert 0 <= relative_padding < 1, "Relative padding must be in [0,1)."
-        pos = np.concatenate((point_positions, agent_positions), axis=0)
-        minimum = np.min(pos, axis=0)
-        maximum = np.max(pos, axis=0)
         x_min, y_min, x_max, y_max = (
             minimum[0],
             minimum[1],
@@ -389,6 +456,10 @@ class raw_env(AECEnv):
         lower_y = screen_height * relative_padding
         scaling_y = (upper_y - lower_y) / max_range
         translation_y = -y_min * scaling_y + lower_y
+        # Bake the y-axis inversion into the transform since pygame has its
+        # origin at the top left; this saves a full-surface flip per frame.
+        scaling_y = -scaling_y
+        translation_y = screen_height - translation_y
 
         return (scaling_x, scaling_y), (translation_x, translation_y)
 
@@ -460,13 +531,29 @@ class raw_env(AECEnv):
             surf (pygame.Surface): Surface to convert to image array.
             size (tuple): Tuple of (width, height) to scale surface to.
 
+        Note:
+            The returned array is a persistent buffer that is overwritten
+            by the next rendered frame; copy it to retain a frame.
+
         Returns:
             np.ndarray: Image array.
         """
-        scaled_surf = pygame.transform.smoothscale(surf, size)
-        return np.transpose(
-            np.array(pygame.surfarray.pixels3d(scaled_surf)), axes=(1, 0, 2)
-        )
+        # Scaling is a full bilinear resample, so skip it when the surface
+        # already has the requested size.
+        if size == surf.get_size():
+            scaled_surf = surf
+        else:
+            scaled_surf = pygame.transform.smoothscale(surf, size)
+        if self._rgb_out is None or self._rgb_out.shape[:2] != (
+            size[1],
+            size[0],
+        ):
+            self._rgb_out = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        pixels = pygame.surfarray.pixels3d(scaled_surf)
+        np.copyto(self._rgb_out, pixels.swapaxes(0, 1))
+        # Release the pixel view to unlock the surface again.
+        del pixels
+        return self._rgb_out
 
     def reward(self, collector, point):
         """Returns reward for collecting a given point.
@@ -482,24 +569,103 @@ class raw_env(AECEnv):
         Returns:
             float: Reward.
         """
-        reward = -np.linalg.norm(collector.position - point.position)
+        # math.hypot on the two scalar components avoids the dispatch
+        # overhead of np.linalg.norm for this fixed 2D case.
+        reward = -math.hypot(
+            collector.position[0] - point.position[0],
+            collector.position[1] - point.position[1],
+        )
         reward += self.collection_reward(point)
         if point.is_collected():
             reward -= self.cheating_cost(point)
         return reward
 
-    def _state(
-        self,
-        points,
-        collectors,
-        reveal_cheating_cost,
-        reveal_collection_reward,
-    ):
-        """Retrieves state of the current global environment.
+    def _cached_reward(self, agent, action, point):
+        """Returns reward for collecting a point via cached distances.
+
+        Since collectors always move onto the point they collect, the
+        distance traveled is fully determined by the previously collected
+        point (or the initial agent position) and the chosen point, both of
+        which are precomputed in __init__.
+
+        Args:
+            agent (str): Agent that collects the point.
+            action (int): Index of the point that is collected.
+            point (Point): Point that is collected.
+
+        Returns:
+            float: Reward.
+        """
+        agent_idx = self.agent_name_mapping[agent]
+        last_idx = self._last_point_idx[agent]
+        if last_idx is None:
+            distance = self._init_distances[agent_idx, action]
+        else:
+            distance = self._point_distances[last_idx, action]
+        reward = -distance + self._collection_reward_arr[action]
+        if point.is_collected():
+            reward -= self._cheating_cost_arr[action]
+        return reward
+
+    def _create_state_arrays(self, points, collectors):
+        """Creates cached state arrays for points and collectors.
+
+        The arrays are rebuilt here once per reset and afterwards updated
+        incrementally in step() s.t. _state() does not have to rebuild them
+        for every observation.
 
         Args:
             points (list[Point]): List of points in the environment.
             collectors (dict): Dictionary of collectors.
+        """
+        # Points and collectors are freshly created from the stored
+        # positions, so the arrays can be built with single C-level
+        # conversions instead of per-object Python loops.
+        self._point_positions_arr = np.array(
+            self.point_positions, dtype=np.float64
+        )
+        # Collect counters are small non-negative integers; int32 halves
+        # the memory bandwidth compared to the platform default int64.
+        self._collected_arr = np.zeros(self._n_points, dtype=np.int32)
+        self._collector_positions_arr = np.array(
+            self.agent_positions, dtype=np.float64
+        )
+        self._cheating_cost_arr = np.array(
+            [self.cheating_cost(point) for point in points],
+            dtype=np.float64,
+        )
+        self._collection_reward_arr = np.array(
+            [self.collection_reward(point) for point in points],
+            dtype=np.float64,
+        )
+        # Points are static, so their scaled display positions can be
+        # computed once as a single vectorized operation.
+        self._point_scaled_positions = (
+            self._point_positions_arr * np.asarray(self.scaling)
+            + np.asarray(self.translation)
+        )
+        # Observations receive read-only views on the cached arrays to
+        # guard against consumers mutating shared state.
+        self._state_views = {}
+        for key, arr in (
+            ("point_positions", self._point_positions_arr),
+            ("collected", self._collected_arr),
+            ("collector_positions", self._collector_positions_arr),
+            ("cheating_cost", self._cheating_cost_arr),
+            ("collection_reward", self._collection_reward_arr),
+        ):
+            view = arr.view()
+            view.setflags(write=False)
+            self._state_views[key] = view
+
+    def _state(self, reveal_cheating_cost, reveal_collection_reward):
+        """Retrieves state of the current global environment.
+
+        The returned arrays are cached on the environment and kept up to
+        date in step(), so no per-point or per-collector work is done here.
+        The image entry is only rendered when a consumer actually reads it.
+
+        Args:
             reveal_cheating_cost (bool): Whether to reveal cheating cost.
             reveal_collection_reward (bool): Whether to reveal collection
                 reward.
@@ -507,30 +673,19 @@ class raw_env(AECEnv):
         Returns:
             dict: Current global state.
         """
-        state = {
-            "point_positions": np.array(
-                [point.position for point in points], dtype=np.float64
-            ),
-            "collected": np.array(
-                [point.get_collect_counter() for point in points], dtype=int
-            ),
-            "collector_positions": np.array(
-                [collector.position for collector in collectors.values()],
-                dtype=np.float64,
-            ),
-            "image": self._render(render_mode="rgb_array"),
+        views = self._state_views
+        entries = {
+            "point_positions": views["point_positions"],
+            "collected": views["collected"],
+            "collector_positions": views["collector_positions"],
         }
         if reveal_cheating_cost:
-            state["cheating_cost"] = np.array(
-                [self.cheating_cost(point) for point in points],
-                dtype=np.float64,
-            )
+            entries["cheating_cost"] = views["cheating_cost"]
         if reveal_collection_reward:
-            state["collection_reward"] = np.array(
-                [self.collection_reward(point) for point in points],
-                dtype=np.float64,
-            )
-        return state
+            entries["collection_reward"] = views["collection_reward"]
+        return LazyImageDict(
+            entries, lambda: self._render(render_mode="rgb_array")
+        )
 
     def observe(self, agent):
         # FIXME: Warning for api_test /Users/lfwa/Library/Caches/pypoetry/
@@ -539,14 +694,12 @@ class raw_env(AECEnv):
         # NumPy array
         # warnings.warn("Observation is not NumPy array")
         return self._state(
-            self.points,
-            self.collectors,
             self.reveal_cheating_cost,
             self.reveal_collection_reward,
         )
 
     def state(self):
-        return self._state(self.points, self.collectors, True, True)
+        return self._state(True, True)
 
     def reset(self, seed=None, return_info=False, options=None):
         if seed is not None:
@@ -562,6 +715,21 @@ class raw_env(AECEnv):
         self.points = self._create_points(
             self.point_positions, self.scaling, self.translation
         )
+        self._create_state_arrays(self.points, self.collectors)
+        # Index of the point each agent collected last, for cached rewards.
+        self._last_point_idx = {agent: None for agent in self.agents}
+        # Scaled path positions per agent for batched polyline rendering,
+        # with overlap tracking to detect shared path segments.
+        self._scaled_paths = {
+            agent: [self._scale_position(collector.position)]
+            for agent, collector in self.collectors.items()
+        }
+        self._last_path_pos = {
+            agent: tuple(collector.position)
+            for agent, collector in self.collectors.items()
+        }
+        self._path_segments = set()
+        self._paths_overlap = False
 
         self.iteration = 0
         self.total_points_collected = 0
@@ -597,21 +765,58 @@ class raw_env(AECEnv):
                 self.agent_selection = self._agent_selector.next()
             return
 
-        if (
-            not self.action_space(agent).contains(action)
-            and action is not None
+        # Cheap inline check equivalent to action_space(agent).contains() to
+        # keep Space.contains() overhead out of the per-step hot path.
+        # Like Discrete.contains(), 0-d integer arrays count as integers.
+        if action is not None and not (
+            (
+                isinstance(action, (int, np.integer))
+                or (
+                    isinstance(action, np.ndarray)
+                    and action.ndim == 0
+                    and np.issubdtype(action.dtype, np.integer)
+                )
+            )
+            and 0 <= action < self._n_points
         ):
             raise ValueError(f"Action {action} is invalid for agent {agent}.")
 
         if action is not None:
             point_to_collect = self.points[action]
             collector = self.collectors[agent]
-            reward = self.reward(collector, point_to_collect)
+            if self.cache_distances:
+                reward = self._cached_reward(agent, action, point_to_collect)
+            else:
+                reward = self.reward(collector, point_to_collect)
             # Move collector to point position.
             collector.move(point_to_collect.position)
             # Only collect point after reward has been calculated.
             collector.collect(point_to_collect, self.total_points_collected)
             self.total_points_collected += 1
+            # Update cached state arrays for the changed entries only.
+            self._collector_positions_arr[
+                self.agent_name_mapping[agent]
+            ] = point_to_collect.position
+            self._collected_arr[action] = (
+                point_to_collect.get_collect_counter()
+            )
+            self._last_point_idx[agent] = action
+            # Extend the cached scaled path and track segment overlaps.
+            self._scaled_paths[agent].append(
+                tuple(self._point_scaled_positions[action])
+            )
+            prev_pos = self._last_path_pos[agent]
+            new_pos = tuple(point_to_collect.position)
+            segment = (
+                (prev_pos, new_pos)
+                if prev_pos <= new_pos
+                else (new_pos, prev_pos)
+            )
+            if segment in self._path_segments:
+                self._paths_overlap = True
+            else:
+                self._path_segments.add(segment)
+            self._last_path_pos[agent] = new_pos
         else:
             reward = 0
 
@@ -662,6 +867,12 @@ class raw_env(AECEnv):
                 `rgb_array`, otherwise returns None.
         """
         pygame.font.init()
+        if self._font is None:
+            # Creating a font parses the underlying TTF file, so only do it
+            # once instead of for every frame.
+            self._font = pygame.font.Font(
+                pygame.font.get_default_font(), FONT_SIZE
+            )
         if self.screen is None and render_mode == "human":
             pygame.init()
             pygame.display.init()
@@ -671,18 +882,28 @@ class raw_env(AECEnv):
         if self.clock is None:
             self.clock = pygame.time.Clock()
 
-        self.surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if self.surf is None:
+            # Reuse one drawing surface and one pre-filled background
+            # surface across frames instead of reallocating them each call.
+            self.surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._bg_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._bg_surf.fill((255, 255, 255))
 
         # Add white background.
-        self.surf.fill((255, 255, 255))
+        self.surf.blit(self._bg_surf, (0, 0))
+        self._dirty_rects = []
 
         self._render_points(self.surf, self.points, POINT_SIZE)
+        # Lock the surface once around the line-based helpers s.t. each
+        # draw call does not have to lock and unlock it individually.
+        self.surf.lock()
         self._render_paths(self.surf, self.collectors, PATH_SIZE)
         self._render_collectors(
             self.surf, self.collectors, COLLECTOR_LEN, COLLECTOR_SIZE
         )
-        # Flip y-axis since pygame has origin at top left.
-        self.surf = pygame.transform.flip(self.surf, flip_x=False, flip_y=True)
+        self.surf.unlock()
+        # The y-axis flip is baked into scaling/translation, so drawing
+        # happens directly in display coordinates.
         self._render_text(self.surf)
 
         if render_mode == "human":
@@ -690,7 +911,16 @@ class raw_env(AECEnv):
             self.clock.tick(self.metadata["render_fps"])
             assert self.screen is not None
             self.screen.blit(self.surf, (0, 0))
-            pygame.display.update()
+            if self._prev_dirty_rects is None:
+                # First frame, paint the entire display.
+                pygame.display.update()
+            else:
+                # Only push regions drawn this frame or cleared since the
+                # previous frame to the window system.
+                pygame.display.update(
+                    self._prev_dirty_rects + self._dirty_rects
+                )
+            self._prev_dirty_rects = self._dirty_rects
         elif render_mode == "rgb_array":
             return self._create_image_array(
                 self.surf, (SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -709,7 +939,7 @@ class raw_env(AECEnv):
             overall_cheated,
         ) = self._get_stats()
         total_reward = sum(self.cumulative_rewards.values())
-        font = pygame.font.Font(pygame.font.get_default_font(), FONT_SIZE)
+        font = self._font
         text1 = font.render(
             (
                 f"Iteration: {self.iteration} | "
@@ -726,8 +956,8 @@ class raw_env(AECEnv):
             True,
             (0, 0, 255),
         )
-        surf.blit(text1, (10, 10))
-        surf.blit(text2, (10, 40))
+        self._dirty_rects.append(surf.blit(text1, (10, 10)))
+        self._dirty_rects.append(surf.blit(text2, (10, 40)))
 
     def _get_stats(self):
         """Retrieves stats for all collectors.
@@ -758,30 +988,56 @@ class raw_env(AECEnv):
             overall_cheated,
         )
 
+    def _get_point_sprite(self, point_size):
+        """Returns a cached sprite for rendering uncollected points.
+
+        The circle is rasterized once and stamped via blits() afterwards.
+
+        Args:
+            point_size (int): Render size of points.
+
+        Returns:
+            pygame.Surface: Sprite with an uncollected point drawn on it.
+        """
+        if self._point_sprite is None:
+            sprite = pygame.Surface(
+                (point_size, point_size), pygame.SRCALPHA
+            )
+            pygame.draw.circle(
+                sprite,
+                colorpicker.get_color_by_name("lightgrey"),
+                (point_size / 2, point_size / 2),
+                point_size / 2,
+            )
+            self._point_sprite = sprite
+        return self._point_sprite
+
     def _render_points(self, surf, points, point_size):
         """Renders all points as circles.
 
         Points are colored according to their collector as a pie chart.
+        Uncollected points share a single pre-rendered sprite and are
+        stamped in one blits() call.
 
         Args:
             surf (pygame.Surface): Surface to render points on.
             points (list[Points]): List of points to render.
             point_size (int): Render size of points.
         """
-        for point in points:
-            x, y = tuple(point.scaled_position - (point_size / 2))
-            bounding_box = pygame.Rect(x, y, point_size, point_size)
+        sprite = self._get_point_sprite(point_size)
+        blit_sequence = []
+        for point, scaled_position in zip(
+            points, self._point_scaled_positions
+        ):
+            x, y = tuple(scaled_position - (point_size / 2))
             total_collections = point.get_collect_counter()
             start_angle = 0
 
             if total_collections == 0:
-                pygame.draw.circle(
-                    surf,
-                    point.color,
-                    tuple(point.scaled_position),
-                    point_size / 2,
-                )
+                blit_sequence.append((sprite, (x, y)))
             else:
+                bounding_box = pygame.Rect(x, y, point_size, point_size)
+                self._dirty_rects.append(bounding_box)
                 for (
                     collector_id,
                     collections,
@@ -798,6 +1054,8 @@ class raw_env(AECEnv):
                         point_size,
                     )
                     start_angle += arc_length
+        if blit_sequence:
+            self._dirty_rects.extend(surf.blits(blit_sequence))
 
     def _render_paths(self, surf, collectors, path_size):
         """Renders paths taken by collectors.
@@ -805,11 +1063,29 @@ class raw_env(AECEnv):
         Colors are assigned to paths based on the collector that took it.
         If paths overlap then they are colored in segments.
 
+        As long as no segments are shared between paths, each collector's
+        full path is drawn as a single cached polyline; the per-segment
+        splitting below only runs once an overlap exists.
+
         Args:
             surf (pygame.Surface): Surface to render paths on.
             collectors (dict): Dict of collectors.
             path_size (int): Render size of paths.
         """
+        if not self._paths_overlap:
+            for agent, scaled_path in self._scaled_paths.items():
+                if len(scaled_path) < 2:
+                    continue
+                rect = pygame.draw.lines(
+                    surf,
+                    collectors[agent].color,
+                    False,
+                    scaled_path,
+                    path_size,
+                )
+                self._dirty_rects.append(rect)
+            return
+
         path_pairs = {}
         for collector in collectors.values():
             path_pos_len = len(collector.path_positions)
@@ -837,13 +1113,14 @@ class raw_env(AECEnv):
             segment_y = (y - prev_y) / total_collectors
 
             for collector in collectors:
-                pygame.draw.line(
+                rect = pygame.draw.line(
                     surf,
                     collector.color,
                     (prev_x, prev_y),
                     (prev_x + segment_x, prev_y + segment_y),
                     path_size,
                 )
+                self._dirty_rects.append(rect)
                 prev_x += segment_x
                 prev_y += segment_y
 
@@ -872,9 +1149,10 @@ class raw_env(AECEnv):
 
             for i, collector in enumerate(colls):
                 cross_rotate_shift = i * shift_increment
-                # Add black border to cross.
+                # Add black border to cross. The border rects cover the
+                # cross rects, so tracking them as dirty is sufficient.
                 border_size = math.ceil(collector_size * 1.7)
-                pygame.draw.line(
+                rect = pygame.draw.line(
                     surf,
                     (0, 0, 0),
                     start_pos=(
@@ -887,7 +1165,8 @@ class raw_env(AECEnv):
                     ),
                     width=border_size,
                 )
-                pygame.draw.line(
+                self._dirty_rects.append(rect)
+                rect = pygame.draw.line(
                     surf,
                     (0, 0, 0),
                     start_pos=(
@@ -900,6 +1179,7 @@ class raw_env(AECEnv):
                     ),
                     width=border_size,
                 )
+                self._dirty_rects.append(rect)
                 # Draw cross.
                 pygame.draw.line(
                     surf,
@@ -935,7 +1215,12 @@ class raw_env(AECEnv):
         return self.action_spaces[agent]
 
     def seed(self, seed=None):
-        self.rng, seed = gymnasium.utils.seeding.np_random(seed)
+        # Only construct a new generator when explicitly re-seeded; calling
+        # seed(None) repeatedly would otherwise discard the existing rng
+        # (e.g. SamplingWrapperEnv seeds once before sampling and the
+        # subsequent __init__ would immediately replace that generator).
+        if seed is not None or not hasattr(self, "rng"):
+            self.rng, seed = gymnasium.utils.seeding.np_random(seed)
         return [seed]
 
     def close(self):
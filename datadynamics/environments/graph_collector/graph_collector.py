@@ -4,10 +4,10 @@ from itertools import groupby
 import gymnasium
 import numpy as np
 import pygame
-from pettingzoo.utils import agent_selector
 from pettingzoo.utils.env import AECEnv
 
 from datadynamics.utils.objects import Collector, Point
+from datadynamics.utils.observations import LazyImageDict
 
 FPS = 120
 SCREEN_WIDTH = 1000
@@ -18,6 +18,9 @@ PATH_SIZE = 2
 COLLECTOR_SIZE = 4
 COLLECTOR_LEN = 15
 FONT_SIZE = 12
+# Upper bound on node count for dense per-node caches, which require
+# O(n_nodes^2) memory. Larger graphs fall back to adjacency-dict lookups.
+DENSE_CACHE_MAX_NODES = 2048
 
 
 def env(**kwargs):
@@ -160,6 +163,46 @@ class raw_env(AECEnv):
         self.reveal_cheating_cost = reveal_cheating_cost
         self.reveal_collection_reward = reveal_collection_reward
         self.static_graph = static_graph
+        # Node count fixes the action space; cached for the inlined action
+        # range check in step().
+        self._n_nodes = len(self.graph.nodes)
+
+        # Neighbor lookups sit on the hot path for action masks and action
+        # sampling; precompute them as integer arrays for static graphs
+        # instead of walking the adjacency dict on every call.
+        if static_graph:
+            self._neighbor_arrays = [
+                np.fromiter(self.graph.adj[node], dtype=int)
+                for node in range(len(self.graph.nodes))
+            ]
+            # Action masks only depend on the current node for static
+            # graphs, so memoize them lazily per node as read-only arrays.
+            # Each mask is dense over all nodes, so the cache is quadratic
+            # in the node count once agents have visited the whole graph;
+            # skip memoization for large graphs.
+            if self._n_nodes <= DENSE_CACHE_MAX_NODES:
+                self._action_mask_cache = {}
+            else:
+                self._action_mask_cache = None
+            # Flatten edge weights into a dense float32 matrix so reward()
+            # can replace the chained adjacency-dict lookups with a single
+            # array load; missing edges are marked with NaN. The matrix is
+            # quadratic in the node count, so reward() keeps using the
+            # adjacency dict directly for large graphs.
+            n_nodes = self._n_nodes
+            if n_nodes <= DENSE_CACHE_MAX_NODES:
+                self._weight_matrix = np.full(
+                    (n_nodes, n_nodes), np.nan, dtype=np.float32
+                )
+                for node in range(n_nodes):
+                    for neighbor, data in self.graph.adj[node].items():
+                        self._weight_matrix[node, neighbor] = data["weight"]
+            else:
+                self._weight_matrix = None
+        else:
+            self._neighbor_arrays = None
+            self._action_mask_cache = None
+            self._weight_matrix = None
 
         if nodes_per_row is None:
             nodes_per_row = math.ceil(math.sqrt(len(self.graph.nodes)))
@@ -180,6 +223,50 @@ class raw_env(AECEnv):
             SCREEN_HEIGHT,
         )
 
+        # Half-node offsets for centering; hoisted so _center does not
+        # redo the division on every call.
+        self._half_node_width = self.node_width / 2
+        self._half_node_height = self.node_height / 2
+
+        # For static graphs the grid layout is fixed, so resolve every
+        # node's screen position once and make _get_node_position a table
+        # lookup; dynamic graphs may gain nodes and keep the arithmetic.
+        if static_graph:
+            labels = np.arange(self._n_nodes)
+            self._node_positions = list(
+                zip(
+                    (
+                        (labels % self.nodes_per_row) * self.node_width
+                    ).tolist(),
+                    (
+                        (labels // self.nodes_per_row) * self.node_height
+                    ).tolist(),
+                )
+            )
+        else:
+            self._node_positions = None
+
+        # Obstacles are invariant for static graphs, so resolve their
+        # display rectangles once instead of rescanning all nodes when
+        # rendering.
+        if static_graph:
+            self._obstacle_rects = [
+                pygame.Rect(
+                    *self._get_node_position(
+                        node_label=node,
+                        nodes_per_row=self.nodes_per_row,
+                        node_width=self.node_width,
+                        node_height=self.node_height,
+                    ),
+                    self.node_width,
+                    self.node_height,
+                )
+                for node in range(len(self.graph.nodes))
+                if self._neighbor_arrays[node].size == 0
+            ]
+        else:
+            self._obstacle_rects = None
+
         self.reward_range = (-np.inf, 0)
 
         self.agents = [
@@ -189,7 +276,10 @@ class raw_env(AECEnv):
         self.agent_name_mapping = {
             agent: i for i, agent in enumerate(self.agents)
         }
-        self._agent_selector = agent_selector(self.agents)
+        # Agents act in a fixed round-robin order; a plain index into this
+        # list is cheaper than pettingzoo's agent_selector on the hot path.
+        self._agent_order = self.agents[:]
+        self._agent_idx = 0
         self.max_collect = {
             agent: max_collect[i] for i, agent in enumerate(self.agents)
         }
@@ -216,10 +306,23 @@ class raw_env(AECEnv):
             SCREEN_WIDTH,
             SCREEN_HEIGHT,
         )
+        # Index-based space access for hot loops that already hold the
+        # integer agent id; the dict-based methods remain the public API.
+        self._obs_spaces_by_idx = tuple(
+            self.observation_spaces[agent] for agent in self.agents
+        )
+        self._act_spaces_by_idx = tuple(
+            self.action_spaces[agent] for agent in self.agents
+        )
 
         # The following are set in reset().
         self.iteration = 0
         self.total_points_collected = 0
+        self._overall_unique_collected = 0
+        self._overall_cheated = 0
+        self._env_version = 0
+        self._last_obs = None
+        self._frame_version = -1
         self.points = None
         self.agent_selection = None
         self.has_reset = False
@@ -233,12 +336,37 @@ class raw_env(AECEnv):
         self.infos = None
         self.collectors = None
         self.cumulative_rewards = None
+        # Cached static state arrays, built in reset().
+        self._point_labels_arr = None
+        self._cheating_cost_arr = None
+        self._collection_reward_arr = None
 
         # pygame
         self.screen = None
         self.clock = None
         self.surf = None
         self.cached_obstacle_surf = None
+        self.cached_background_surf = None
+        self._rgb_out = None
+        # Circle sprites pre-rasterized per (color, size) so uncollected
+        # points can be stamped with a single batched blits() call.
+        self._point_sprites = {}
+        # Font and rendered-text caches; TTF rasterization is one of
+        # pygame's slowest operations, so repeated strings are reused.
+        self._font = None
+        self._text_cache = {}
+        # Cross sprites pre-rendered per (color, len, size) so unstacked
+        # collectors can be stamped with a single batched blits() call.
+        self._cross_sprites = {}
+        # Memoized pygame.Color objects so SDL does not re-parse color
+        # tuples on every draw call.
+        self._pg_colors = {}
+        self._pg_black = pygame.Color(0, 0, 0)
+        # Dirty rectangles for partial display updates in human mode.
+        self._dirty_rects = []
+        self._prev_dirty_rects = None
+        self._pending_bg_rects = []
+        self._dirty_all = False
         self.isopen = False
 
         gymnasium.logger.info("Environment initialized.")
@@ -452,6 +580,10 @@ class raw_env(AECEnv):
     ):
         """Returns the position of a node to be displayed on the screen.
 
+        For static graphs, positions are read from a table precomputed at
+        construction; dynamic graphs (or labels beyond the table, e.g.
+        nodes added after construction) fall back to the arithmetic.
+
         Args:
             node_label (int): Node label.
             nodes_per_row (int): No. of nodes per row.
@@ -461,6 +593,10 @@ class raw_env(AECEnv):
         Returns:
             tuple: (x, y) position of the node (with origin at top-left).
         """
+        if self._node_positions is not None and node_label < len(
+            self._node_positions
+        ):
+            return self._node_positions[node_label]
         x = (node_label % nodes_per_row) * node_width
         y = (node_label // nodes_per_row) * node_height
         return (x, y)
@@ -529,13 +665,31 @@ class raw_env(AECEnv):
             surf (pygame.Surface): Surface to convert to image array.
             size (tuple): Tuple of (width, height) to scale surface to.
 
+        Note:
+            The returned array is a persistent buffer that is overwritten
+            by the next rendered frame; copy it to retain a frame.
+
         Returns:
             np.ndarray: Image array.
         """
-        scaled_surf = pygame.transform.smoothscale(surf, size)
-        return np.transpose(
-            np.array(pygame.surfarray.pixels3d(scaled_surf)), axes=(1, 0, 2)
-        )
+        # Scaling is a full bilinear resample, so skip it when the surface
+        # already has the requested size.
+        if size == surf.get_size():
+            scaled_surf = surf
+        else:
+            scaled_surf = pygame.transform.smoothscale(surf, size)
+        if self._rgb_out is None or self._rgb_out.shape[:2] != (
+            size[1],
+            size[0],
+        ):
+            self._rgb_out = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        # Read the pixels through a zero-copy view and copy them into the
+        # persistent output buffer.
+        pixels = pygame.surfarray.pixels3d(scaled_surf)
+        np.copyto(self._rgb_out, pixels.swapaxes(0, 1))
+        # Release the pixel view to unlock the surface again.
+        del pixels
+        return self._rgb_out
 
     def reward(self, cur_node, action):
         """Returns reward for executing action in cur_node.
@@ -564,10 +718,20 @@ class raw_env(AECEnv):
                 f"Node {cur_node} is not a point. Action cannot be `collect` "
                 "(-1)."
             )
-            # Add reward for collecting a point, and add penalty if cheating.
+            # Add reward for collecting a point, and add penalty if
+            # cheating. The collected-count array doubles as an
+            # is_collected bitmap without touching the Point object.
             reward = self.collection_reward(cur_node)
-            if self.points[cur_node].is_collected():
+            if self._collected_arr[self._point_index[cur_node]]:
                 reward -= self.cheating_cost(cur_node)
+        elif self._weight_matrix is not None:
+            weight = self._weight_matrix[cur_node, action]
+            if np.isnan(weight):
+                raise ValueError(
+                    f"There is no weighted edge between node {cur_node} and "
+                    f"{action}. Reward cannot be calculated."
+                )
+            reward = -weight
         else:
             try:
                 reward = -self.graph.adj[cur_node][action]["weight"]
@@ -578,20 +742,15 @@ class raw_env(AECEnv):
                 )
         return reward
 
-    def _state(
-        self,
-        graph,
-        points,
-        collectors,
-        reveal_cheating_cost,
-        reveal_collection_reward,
-    ):
+    def _state(self, reveal_cheating_cost, reveal_collection_reward):
         """Retrieves state of the current global environment.
 
+        The returned arrays are cached on the environment and kept up to
+        date in step(), so no per-point or per-collector work is done here.
+        The image entry is rendered lazily on first access since it is by
+        far the most expensive entry and often goes unused.
+
         Args:
-            graph (networkx.Graph): Graph representing the environment.
-            points (dict): Dictionary of points keyed by node labels.
-            collectors (dict): Dictionary of collectors keyed by agent names.
             reveal_cheating_cost (bool): Whether to reveal cheating cost.
             reveal_collection_reward (bool): Whether to reveal collection
                 reward.
@@ -599,34 +758,19 @@ class raw_env(AECEnv):
         Returns:
             dict: Current global state.
         """
-        state = {
-            "point_labels": np.array(
-                [point.label for point in points.values()], dtype=int
-            ),
-            "collector_labels": np.array(
-                [collector.label for collector in collectors.values()],
-                dtype=int,
-            ),
-            "collected": np.array(
-                [point.get_collect_counter() for point in points.values()],
-                dtype=int,
-            ),
-            "image": self._render(render_mode="rgb_array"),
+        views = self._state_views
+        entries = {
+            "point_labels": views["point_labels"],
+            "collector_labels": views["collector_labels"],
+            "collected": views["collected"],
         }
         if reveal_cheating_cost:
-            state["cheating_cost"] = np.array(
-                [self.cheating_cost(point.label) for point in points.values()],
-                dtype=np.float64,
-            )
+            entries["cheating_cost"] = views["cheating_cost"]
         if reveal_collection_reward:
-            state["collection_reward"] = np.array(
-                [
-                    self.collection_reward(point.label)
-                    for point in points.values()
-                ],
-                dtype=np.float64,
-            )
-        return state
+            entries["collection_reward"] = views["collection_reward"]
+        return LazyImageDict(
+            entries, lambda: self._render(render_mode="rgb_array")
+        )
 
     def _get_action_mask(self, agent):
         """Retrieves action mask and whether `collect` (-1) can be issued.
@@ -644,11 +788,21 @@ class raw_env(AECEnv):
             tuple(np.ndarray, bool): Tuple action mask and validity of the
                 `collect` (-1) action.
         """
-        action_mask = np.zeros(len(self.graph.nodes), dtype=int)
         cur_node = self.collectors[agent].label
-        neighbors = self.graph.neighbors(cur_node)
-        for neighbor in neighbors:
-            action_mask[neighbor] = 1
+        if self._action_mask_cache is not None:
+            action_mask = self._action_mask_cache.get(cur_node)
+            if action_mask is None:
+                action_mask = np.zeros(len(self.graph.nodes), dtype=int)
+                action_mask[self._neighbor_arrays[cur_node]] = 1
+                action_mask.setflags(write=False)
+                self._action_mask_cache[cur_node] = action_mask
+        else:
+            action_mask = np.zeros(len(self.graph.nodes), dtype=int)
+            if self._neighbor_arrays is not None:
+                action_mask[self._neighbor_arrays[cur_node]] = 1
+            else:
+                for neighbor in self.graph.neighbors(cur_node):
+                    action_mask[neighbor] = 1
         collect_action_validity = int(cur_node in self.points)
         return action_mask, collect_action_validity
 
@@ -658,10 +812,18 @@ class raw_env(AECEnv):
         # pettingzoo/test/api_test.py:60: UserWarning: Observation is not
         # NumPy array
         # warnings.warn("Observation is not NumPy array")
+        # Wrappers commonly observe the same agent twice between steps
+        # (e.g. aec_to_parallel); reuse the previous observation when the
+        # environment has not advanced in between. The version counter
+        # cannot see external graph mutations, so only static graphs are
+        # memoized.
+        if (
+            self.static_graph
+            and self._last_obs is not None
+            and self._last_obs[:2] == (agent, self._env_version)
+        ):
+            return self._last_obs[2]
         obs = self._state(
-            self.graph,
-            self.points,
-            self.collectors,
             self.reveal_cheating_cost,
             self.reveal_collection_reward,
         )
@@ -669,28 +831,100 @@ class raw_env(AECEnv):
             obs["action_mask"],
             obs["collect_action_validity"],
         ) = self._get_action_mask(agent)
+        self._last_obs = (agent, self._env_version, obs)
         return obs
 
     def state(self):
-        return self._state(
-            self.graph, self.points, self.collectors, True, True
-        )
+        return self._state(True, True)
+
+    def _next_agent(self):
+        """Advances to and returns the next agent in round-robin order.
+
+        Returns:
+            str: Name of the next agent.
+        """
+        self._agent_idx = (self._agent_idx + 1) % len(self._agent_order)
+        return self._agent_order[self._agent_idx]
 
     def reset(self, seed=None, return_info=False, options=None):
         if seed is not None:
             self.seed(seed)
 
         self.agents = self.possible_agents[:]
-        self._agent_selector.reinit(self.agents)
-        self.agent_selection = self._agent_selector.reset()
+        self._agent_order = self.agents[:]
+        self._agent_idx = 0
+        self.agent_selection = self._agent_order[0]
 
         self.collectors = self._create_collectors(
             self.init_agent_labels, self.agents
         )
+        # Cached centered pixel paths and segment bookkeeping for path
+        # rendering; extended incrementally as collectors move.
+        self._path_segments = set()
+        self._paths_overlap = False
+        self._centered_paths = {
+            agent: [self._center(collector.position)]
+            for agent, collector in self.collectors.items()
+        }
+        # Persistent layer that accumulates drawn path segments so each
+        # frame only has to draw segments added since the previous one.
+        self._paths_layer = None
+        self._paths_drawn = None
+        # Collector colors never change; a flat lookup avoids the dict
+        # plus attribute access per agent on the render path.
+        self._agent_colors = {
+            agent: self._get_pg_color(collector.color)
+            for agent, collector in self.collectors.items()
+        }
         self.points = self._create_points(self._point_labels)
+        # Points never change during an episode, so the arrays derived
+        # from them are built once here instead of on every observation.
+        self._point_labels_arr = np.array(self._point_labels, dtype=int)
+        self._cheating_cost_arr = np.array(
+            [self.cheating_cost(label) for label in self._point_labels],
+            dtype=np.float64,
+        )
+        self._collection_reward_arr = np.array(
+            [self.collection_reward(label) for label in self._point_labels],
+            dtype=np.float64,
+        )
+        # Cached state arrays, updated in place in step() instead of being
+        # rebuilt for every observation. Observations receive read-only
+        # views to guard against consumers mutating shared state.
+        self._point_index = {
+            label: i for i, label in enumerate(self.points)
+        }
+        self._collector_labels_arr = np.array(
+            [collector.label for collector in self.collectors.values()],
+            dtype=int,
+        )
+        self._collected_arr = np.zeros(len(self.points), dtype=int)
+        self._state_views = {}
+        for key, arr in (
+            ("point_labels", self._point_labels_arr),
+            ("collector_labels", self._collector_labels_arr),
+            ("collected", self._collected_arr),
+            ("cheating_cost", self._cheating_cost_arr),
+            ("collection_reward", self._collection_reward_arr),
+        ):
+            view = arr.view()
+            view.setflags(write=False)
+            self._state_views[key] = view
+        # Points were recreated, so the cached background is stale.
+        self.cached_background_surf = None
+        # Frame history from the previous episode is invalid.
+        self._prev_dirty_rects = None
+        self._pending_bg_rects = []
 
         self.iteration = 0
         self.total_points_collected = 0
+        self._overall_unique_collected = 0
+        self._overall_cheated = 0
+        # Version counter invalidating memoized observations after steps.
+        self._env_version = 0
+        self._last_obs = None
+        # The cached frame belongs to the previous episode.
+        self._frame_version = -1
         self.has_reset = True
         self.terminate = False
         self.truncate = False
@@ -701,6 +935,9 @@ class raw_env(AECEnv):
         self.truncations = {agent: False for agent in self.agents}
         self.infos = {agent: {} for agent in self.agents}
         self.cumulative_rewards = {agent: 0 for agent in self.agents}
+        # Running total across agents so rendering does not have to reduce
+        # the cumulative reward dict every frame.
+        self._total_reward = 0
 
         observations = {agent: self.observe(agent) for agent in self.agents}
 
@@ -721,17 +958,31 @@ class raw_env(AECEnv):
             # Guard against first agent dying first since _was_dead_step()
             # does not update agent_selection when that happens.
             if self.agent_selection not in self.agents and self.agents:
-                self.agent_selection = self._agent_selector.next()
+                self.agent_selection = self._next_agent()
             return
 
-        if (
-            not self.action_space(agent).contains(action)
-            and action is not None
+        # Inlined Discrete(n + 1, start=-1).contains(); the space method
+        # costs a dict lookup and Python dispatch on every step.
+        # Like Discrete.contains(), 0-d integer arrays count as integers.
+        if action is not None and not (
+            (
+                isinstance(action, (int, np.integer))
+                or (
+                    isinstance(action, np.ndarray)
+                    and action.ndim == 0
+                    and np.issubdtype(action.dtype, np.integer)
+                )
+            )
+            and -1 <= action < self._n_nodes
         ):
             raise ValueError(
                 f"Action {action} is not in the action space for "
                 f"agent {agent}."
             )
+        if isinstance(action, np.ndarray):
+            # Normalize 0-d arrays so node labels used as dict and set
+            # keys below stay hashable.
+            action = int(action)
 
         action_mask, collect_action_validity = self._get_action_mask(agent)
         collector = self.collectors[agent]
@@ -746,10 +997,18 @@ class raw_env(AECEnv):
 
             if action == -1:
                 # Collect point.
+                if self._collected_arr[self._point_index[cur_node]]:
+                    self._overall_cheated += 1
+                else:
+                    self._overall_unique_collected += 1
                 collector.collect(
                     self.points[cur_node], self.total_points_collected
                 )
                 self.total_points_collected += 1
+                self._collected_arr[self._point_index[cur_node]] += 1
+                # Repaint only the collected point on the cached
+                # background.
+                self._update_background_point(self.points[cur_node])
             else:
                 # Move agent to the new node label.
                 collector.move(
@@ -761,6 +1020,23 @@ class raw_env(AECEnv):
                     ),
                     label=action,
                 )
+                self._collector_labels_arr[
+                    self.agent_name_mapping[agent]
+                ] = action
+                # Extend the cached centered path and track segment
+                # overlaps for rendering.
+                segment = (
+                    (cur_node, action)
+                    if cur_node <= action
+                    else (action, cur_node)
+                )
+                if segment in self._path_segments:
+                    self._paths_overlap = True
+                else:
+                    self._path_segments.add(segment)
+                self._centered_paths[agent].append(
+                    self._center(collector.position)
+                )
         else:
             reward = 0
 
@@ -774,14 +1050,16 @@ class raw_env(AECEnv):
         self.terminate = all(self.terminations.values())
         self.truncate = all(self.truncations.values())
         self.iteration += 1
+        self._env_version += 1
 
         self.rewards[agent] = reward
         self.cumulative_rewards[agent] += reward
+        self._total_reward += reward
         # Cumulative reward since agent has last acted.
         self._cumulative_rewards[agent] = 0
         self._accumulate_rewards()
 
-        self.agent_selection = self._agent_selector.next()
+        self.agent_selection = self._next_agent()
 
         if self.render_mode == "human":
             self.render()
@@ -810,6 +1088,17 @@ class raw_env(AECEnv):
             np.ndarray or None: Returns the rendered image if render_mode is
                 `rgb_array`, otherwise returns None.
         """
+        # The environment has not advanced since the last readback, so the
+        # cached frame is still valid (e.g. state() followed by render()).
+        # The version counter cannot see external graph mutations, so
+        # dynamic graphs re-render every frame to ensure consistency.
+        if (
+            render_mode == "rgb_array"
+            and self.static_graph
+            and self._frame_version == self._env_version
+            and self._rgb_out is not None
+        ):
+            return self._rgb_out
         pygame.font.init()
         if self.screen is None and render_mode == "human":
             pygame.init()
@@ -827,23 +1116,19 @@ class raw_env(AECEnv):
         if self.clock is None:
             self.clock = pygame.time.Clock()
 
-        self.surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # The surface is reused across frames; the full-screen background
+        # blit below overwrites the previous frame, so no clear is needed.
+        if self.surf is None:
+            self.surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        # Add white background.
-        self.surf.fill((255, 255, 255))
+        # Regions changed since the previous frame: background patches
+        # from collected points plus whatever the helpers draw below.
+        self._dirty_rects = self._pending_bg_rects
+        self._pending_bg_rects = []
+
+        # Blits the white background incl. obstacles and points.
+        self._render_background(self.surf)
 
-        self._render_obstacles(
-            surf=self.surf,
-            nodes=self.graph.nodes,
-            nodes_per_row=self.nodes_per_row,
-            node_width=self.node_width,
-            node_height=self.node_height,
-        )
-        self._render_points(
-            surf=self.surf,
-            points=self.points,
-            point_size=POINT_SIZE,
-        )
         self._render_paths(
             surf=self.surf,
             collectors=self.collectors,
@@ -862,11 +1147,63 @@ class raw_env(AECEnv):
             self.clock.tick(self.metadata["render_fps"])
             assert self.screen is not None
             self.screen.blit(self.surf, (0, 0))
-            pygame.display.update()
+            if self._prev_dirty_rects is None or self._dirty_all:
+                # First frame (or full redraw), paint the entire display.
+                pygame.display.update()
+                self._dirty_all = False
+            else:
+                # Only push regions drawn this frame or cleared since the
+                # previous frame to the window system.
+                pygame.display.update(
+                    self._prev_dirty_rects + self._dirty_rects
+                )
+            self._prev_dirty_rects = self._dirty_rects
         elif render_mode == "rgb_array":
-            return self._create_image_array(
+            image = self._create_image_array(
                 self.surf, (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
+            self._frame_version = self._env_version
+            return image
+
+    @classmethod
+    def render_batch(cls, envs, tile_cols=None):
+        """Renders several environments as tiles of a single image.
+
+        Each environment renders through its own cached pipeline and the
+        frames are composited into one grid, which is cheaper than
+        handling N separate frames downstream (e.g. for logging many
+        parallel environments).
+
+        Note:
+            The intermediate frames alias each environment's persistent
+            render buffer; the returned composite is freshly allocated per
+            call and safe to hold on to.
+
+        Args:
+            envs (list): Environments to render; all must share the same
+                frame size.
+            tile_cols (int, optional): No. of tiles per row. Defaults to
+                an approximately square grid.
+
+        Returns:
+            np.ndarray: Image array with one tile per environment.
+        """
+        assert envs, "Cannot render a batch of zero environments."
+        frames = [env._render(render_mode="rgb_array") for env in envs]
+        if tile_cols is None:
+            tile_cols = math.ceil(math.sqrt(len(frames)))
+        tile_rows = math.ceil(len(frames) / tile_cols)
+        height, width, _ = frames[0].shape
+        batch_frame = np.zeros(
+            (tile_rows * height, tile_cols * width, 3), dtype=np.uint8
+        )
+        for i, frame in enumerate(frames):
+            row, col = divmod(i, tile_cols)
+            batch_frame[
+                row * height: (row + 1) * height,
+                col * width: (col + 1) * width,
+            ] = frame
+        return batch_frame
 
     def _render_text(self, surf):
         """Renders information text, e.g. stats about environment and actions.
@@ -874,32 +1211,51 @@ class raw_env(AECEnv):
         Args:
             surf (pygame.Surface): Surface to render text on.
         """
-        (
-            stats,
-            overall_total_points_collected,
-            overall_unique_points_collected,
-            overall_cheated,
-        ) = self._get_stats()
-        total_reward = sum(self.cumulative_rewards.values())
-        font = pygame.font.Font(pygame.font.get_default_font(), FONT_SIZE)
-        text1 = font.render(
-            (
-                f"Iteration: {self.iteration} | "
-                f"Total points collected: {overall_total_points_collected} | "
-                "Unique points collected: "
-                f"{overall_unique_points_collected} / {len(self.points)} | "
-                f"Cheated: {overall_cheated}"
-            ),
-            True,
-            (0, 0, 255),
+        # Overall stats are maintained incrementally in step(); the full
+        # per-agent breakdown from _get_stats() is not needed here.
+        overall_total_points_collected = self.total_points_collected
+        overall_unique_points_collected = self._overall_unique_collected
+        overall_cheated = self._overall_cheated
+        total_reward = self._total_reward
+        text1 = self._render_text_surface(
+            f"Iteration: {self.iteration} | "
+            f"Total points collected: {overall_total_points_collected} | "
+            "Unique points collected: "
+            f"{overall_unique_points_collected} / {len(self.points)} | "
+            f"Cheated: {overall_cheated}"
         )
-        text2 = font.render(
-            f"Total cumulative reward: {total_reward}",
-            True,
-            (0, 0, 255),
+        text2 = self._render_text_surface(
+            f"Total cumulative reward: {total_reward}"
         )
-        surf.blit(text1, (10, 10))
-        surf.blit(text2, (10, 40))
+        self._dirty_rects.append(surf.blit(text1, (10, 10)))
+        self._dirty_rects.append(surf.blit(text2, (10, 40)))
+
+    def _render_text_surface(self, text):
+        """Rasterizes a text string, memoizing the rendered surface.
+
+        The font object is created lazily once and rendered strings are
+        cached so unchanged text (e.g. a stable total reward) is not
+        re-rasterized every frame.
+
+        Args:
+            text (str): Text to rasterize.
+
+        Returns:
+            pygame.Surface: Surface with the rendered text.
+        """
+        text_surf = self._text_cache.get(text)
+        if text_surf is None:
+            if self._font is None:
+                self._font = pygame.font.Font(
+                    pygame.font.get_default_font(), FONT_SIZE
+                )
+            # Keep the cache bounded; iteration counters make most strings
+            # unique, so just drop everything once in a while.
+            if len(self._text_cache) >= 128:
+                self._text_cache.clear()
+            text_surf = self._font.render(text, True, (0, 0, 255))
+            self._text_cache[text] = text_surf
+        return text_surf
 
     def _get_stats(self):
         """Retrieves stats for all collectors.
@@ -930,6 +1286,63 @@ class raw_env(AECEnv):
             overall_cheated,
         )
 
+    def _render_background(self, surf):
+        """Blits the cached background onto the given surface.
+
+        The background consists of the white backdrop, obstacles, and
+        points. It only changes when a point is collected (and recolored),
+        in which case step() patches just that point, so the full redraw
+        happens at most once per episode for static graphs.
+
+        Args:
+            surf (pygame.Surface): Surface to blit background onto.
+        """
+        if self.cached_background_surf is None or not self.static_graph:
+            background_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._render_obstacles(
+                surf=background_surf,
+                nodes=self.graph.nodes,
+                nodes_per_row=self.nodes_per_row,
+                node_width=self.node_width,
+                node_height=self.node_height,
+            )
+            self._render_points(
+                surf=background_surf,
+                points=self.points,
+                point_size=POINT_SIZE,
+            )
+            self.cached_background_surf = background_surf
+
+        surf.blit(self.cached_background_surf, (0, 0))
+
+    def _update_background_point(self, point):
+        """Repaints a single point on the cached background surface.
+
+        If nodes are displayed smaller than the point sprite, a local patch
+        would overwrite neighboring cells, so the cached background is
+        invalidated and rebuilt on the next frame instead.
+
+        Args:
+            point (Point): Point to repaint, e.g. after being collected.
+        """
+        if self.cached_background_surf is None:
+            return
+        if self.node_width < POINT_SIZE or self.node_height < POINT_SIZE:
+            # The patch rect would spill into neighboring cells and erase
+            # their obstacles and points; rebuild the full background on
+            # the next frame instead.
+            self.cached_background_surf = None
+            self._dirty_all = True
+            return
+        x, y = self._center(point.position)
+        rect = pygame.Rect(
+            x - POINT_SIZE / 2, y - POINT_SIZE / 2, POINT_SIZE, POINT_SIZE
+        )
+        self.cached_background_surf.fill((255, 255, 255), rect)
+        self._render_point(self.cached_background_surf, point, POINT_SIZE)
+        # The patched region must reach the display on the next frame.
+        self._pending_bg_rects.append(rect)
+
     def _render_obstacles(
         self, surf, nodes, nodes_per_row, node_width, node_height
     ):
@@ -949,21 +1362,29 @@ class raw_env(AECEnv):
             )
             # Add white background.
             cached_obstacle_surf.fill((255, 255, 255))
-            for node in nodes:
-                if any(True for _ in self.graph.neighbors(node)):
-                    continue
-                x, y = self._get_node_position(
-                    node_label=node,
-                    nodes_per_row=nodes_per_row,
-                    node_width=node_width,
-                    node_height=node_height,
-                )
-                rect = pygame.Rect(x, y, node_width, node_height)
-                pygame.draw.rect(
-                    cached_obstacle_surf,
-                    color=(0, 0, 0),
-                    rect=rect,
-                )
+            if self._obstacle_rects is not None:
+                for rect in self._obstacle_rects:
+                    pygame.draw.rect(
+                        cached_obstacle_surf,
+                        color=(0, 0, 0),
+                        rect=rect,
+                    )
+            else:
+                for node in nodes:
+                    if any(True for _ in self.graph.neighbors(node)):
+                        continue
+                    x, y = self._get_node_position(
+                        node_label=node,
+                        nodes_per_row=nodes_per_row,
+                        node_width=node_width,
+                        node_height=node_height,
+                    )
+                    rect = pygame.Rect(x, y, node_width, node_height)
+                    pygame.draw.rect(
+                        cached_obstacle_surf,
+                        color=(0, 0, 0),
+                        rect=rect,
+                    )
             self.cached_obstacle_surf = cached_obstacle_surf
 
         surf.blit(self.cached_obstacle_surf, (0, 0))
@@ -978,38 +1399,88 @@ class raw_env(AECEnv):
             points (list[Points]): List of points to render.
             point_size (int): Render size of a point.
         """
+        half = point_size / 2
+        blit_sequence = []
         for point in points.values():
-            x, y = self._center(point.position)
-            bounding_box = pygame.Rect(
-                x - point_size / 2, y - point_size / 2, point_size, point_size
+            if point.get_collect_counter() == 0:
+                x, y = self._center(point.position)
+                blit_sequence.append(
+                    (
+                        self._get_point_sprite(point.color, point_size),
+                        (x - half, y - half),
+                    )
+                )
+            else:
+                self._render_point(surf, point, point_size)
+        if blit_sequence:
+            surf.blits(blit_sequence, doreturn=0)
+
+    def _get_point_sprite(self, color, point_size):
+        """Retrieves a pre-rasterized circle sprite for uncollected points.
+
+        Sprites are cached per (color, size) so each circle is only drawn
+        once and can afterwards be stamped via batched blits.
+
+        Args:
+            color (tuple): Color of the point.
+            point_size (int): Render size of a point.
+
+        Returns:
+            pygame.Surface: Sprite surface with the circle drawn on it.
+        """
+        sprite = self._point_sprites.get((color, point_size))
+        if sprite is None:
+            sprite = pygame.Surface(
+                (point_size, point_size), flags=pygame.SRCALPHA
+            )
+            pygame.draw.circle(
+                sprite,
+                color,
+                (point_size / 2, point_size / 2),
+                point_size / 2,
             )
-            total_collections = point.get_collect_counter()
-            start_angle = 0
+            self._point_sprites[(color, point_size)] = sprite
+        return sprite
 
-            if total_collections == 0:
-                pygame.draw.circle(
+    def _render_point(self, surf, point, point_size):
+        """Renders a single point as a circle or pie chart.
+
+        Args:
+            surf (pygame.Surface): Surface to render point on.
+            point (Point): Point to render.
+            point_size (int): Render size of a point.
+        """
+        x, y = self._center(point.position)
+        bounding_box = pygame.Rect(
+            x - point_size / 2, y - point_size / 2, point_size, point_size
+        )
+        total_collections = point.get_collect_counter()
+        start_angle = 0
+
+        if total_collections == 0:
+            pygame.draw.circle(
+                surf,
+                point.color,
+                (x, y),
+                point_size / 2,
+            )
+        else:
+            for (
+                collector_id,
+                collections,
+            ) in point.collector_tracker.items():
+                if collections == 0:
+                    continue
+                arc_length = collections / total_collections * 2 * math.pi
+                pygame.draw.arc(
                     surf,
-                    point.color,
-                    (x, y),
-                    point_size / 2,
+                    self.collectors[collector_id[10:]].color,
+                    bounding_box,
+                    start_angle,
+                    start_angle + arc_length,
+                    point_size,
                 )
-            else:
-                for (
-                    collector_id,
-                    collections,
-                ) in point.collector_tracker.items():
-                    if collections == 0:
-                        continue
-                    arc_length = collections / total_collections * 2 * math.pi
-                    pygame.draw.arc(
-                        surf,
-                        self.collectors[collector_id[10:]].color,
-                        bounding_box,
-                        start_angle,
-                        start_angle + arc_length,
-                        point_size,
-                    )
-                    start_angle += arc_length
+                start_angle += arc_length
 
     def _render_paths(self, surf, collectors, path_size):
         """Renders paths taken by collectors.
@@ -1017,11 +1488,46 @@ class raw_env(AECEnv):
         Colors are assigned to paths based on the collector that took it.
         If paths overlap then they are colored in segments.
 
+        As long as no segments are shared between paths, trails accumulate
+        on a persistent transparent layer: each frame only draws segments
+        added since the previous frame and composites the layer with one
+        blit. The per-segment splitting below only runs once an overlap
+        exists.
+
         Args:
             surf (pygame.Surface): Surface to render paths on.
             collectors (dict): Dict of collectors.
             path_size (int): Render size of paths.
         """
+        if not collectors:
+            return
+        if not self._paths_overlap:
+            if self._paths_layer is None:
+                self._paths_layer = pygame.Surface(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), flags=pygame.SRCALPHA
+                )
+                self._paths_drawn = dict.fromkeys(self._centered_paths, 1)
+            for agent, centered_path in self._centered_paths.items():
+                drawn = self._paths_drawn[agent]
+                if len(centered_path) > drawn:
+                    # Start from the last drawn point so the new segments
+                    # connect to the existing trail.
+                    rect = pygame.draw.lines(
+                        self._paths_layer,
+                        self._agent_colors[agent],
+                        False,
+                        centered_path[drawn - 1:],
+                        path_size,
+                    )
+                    self._dirty_rects.append(rect)
+                    self._paths_drawn[agent] = len(centered_path)
+            surf.blit(self._paths_layer, (0, 0))
+            return
+
+        # Overlapping trails are redrawn in full; fall back to updating
+        # the entire display for this frame.
+        self._dirty_all = True
+
         path_pairs = {}
         for collector in collectors.values():
             path_pos_len = len(collector.path_positions)
@@ -1071,78 +1577,151 @@ class raw_env(AECEnv):
         Collectors are rotated when stacked to avoid overlapping.
         Black borders are added to crosses.
 
+        Lone collectors are stamped from pre-rendered sprites in a single
+        batched blit; the per-line drawing below only runs for stacked
+        collectors whose rotation shift depends on the group size.
+
         Args:
             surf (pygame.Surface): Surface to render collectors on.
             collectors (dict): Dict of collectors.
             collector_len (int): Length of collector cross.
             collector_size (int): Size of collector cross.
         """
+        if not collectors:
+            return
+        border_size = math.ceil(collector_size * 1.7)
+        blit_sequence = []
         for position, colls in groupby(
             collectors.values(), lambda col: col.position
         ):
             position = self._center(position)
             colls = list(colls)
             total_collectors = len(colls)
+            if total_collectors == 1:
+                sprite = self._get_cross_sprite(
+                    colls[0].color, collector_len, collector_size
+                )
+                half = sprite.get_width() / 2
+                blit_sequence.append(
+                    (sprite, (position[0] - half, position[1] - half))
+                )
+                continue
             shift_increment = collector_len / total_collectors
             shift = collector_len / 2
 
             for i, collector in enumerate(colls):
                 cross_rotate_shift = i * shift_increment
+                color = self._get_pg_color(collector.color)
+                # Endpoints are shared between the black border and the
+                # colored cross, so build each pair only once.
+                diag1_start = (
+                    position[0] + cross_rotate_shift - shift,
+                    position[1] - shift,
+                )
+                diag1_end = (
+                    position[0] + shift - cross_rotate_shift,
+                    position[1] + shift,
+                )
+                diag2_start = (
+                    position[0] + shift,
+                    position[1] + cross_rotate_shift - shift,
+                )
+                diag2_end = (
+                    position[0] - shift,
+                    position[1] + shift - cross_rotate_shift,
+                )
                 # Add black border to cross.
-                border_size = math.ceil(collector_size * 1.7)
-                pygame.draw.line(
+                border_rect1 = pygame.draw.line(
                     surf,
-                    (0, 0, 0),
-                    start_pos=(
-                        position[0] + cross_rotate_shift - shift,
-                        position[1] - shift,
-                    ),
-                    end_pos=(
-                        position[0] + shift - cross_rotate_shift,
-                        position[1] + shift,
-                    ),
+                    self._pg_black,
+                    start_pos=diag1_start,
+                    end_pos=diag1_end,
                     width=border_size,
                 )
-                pygame.draw.line(
+                border_rect2 = pygame.draw.line(
                     surf,
-                    (0, 0, 0),
-                    start_pos=(
-                        position[0] + shift,
-                        position[1] + cross_rotate_shift - shift,
-                    ),
-                    end_pos=(
-                        position[0] - shift,
-                        position[1] + shift - cross_rotate_shift,
-                    ),
+                    self._pg_black,
+                    start_pos=diag2_start,
+                    end_pos=diag2_end,
                     width=border_size,
                 )
+                # The border rects bound the colored cross as well.
+                self._dirty_rects.append(border_rect1.union(border_rect2))
                 # Draw cross.
                 pygame.draw.line(
                     surf,
-                    collector.color,
-                    start_pos=(
-                        position[0] + cross_rotate_shift - shift,
-                        position[1] - shift,
-                    ),
-                    end_pos=(
-                        position[0] + shift - cross_rotate_shift,
-                        position[1] + shift,
-                    ),
+                    color,
+                    start_pos=diag1_start,
+                    end_pos=diag1_end,
                     width=collector_size,
                 )
                 pygame.draw.line(
                     surf,
-                    collector.color,
-                    start_pos=(
-                        position[0] + shift,
-                        position[1] + cross_rotate_shift - shift,
-                    ),
-                    end_pos=(
-                        position[0] - shift,
-                        position[1] + shift - cross_rotate_shift,
-                    ),
+                    color,
+                    start_pos=diag2_start,
+                    end_pos=diag2_end,
                     width=collector_size,
                 )
+        if blit_sequence:
+            self._dirty_rects.extend(surf.blits(blit_sequence))
+
+    def _get_cross_sprite(self, color, collector_len, collector_size):
+        """Retrieves a pre-rendered cross sprite for a lone collector.
+
+        Sprites are cached per (color, len, size) with the black border
+        already applied, so rendering an unstacked collector is a single
+        blit instead of four line draws.
+
+        Args:
+            color (tuple): Color of the collector.
+            collector_len (int): Length of collector cross.
+            collector_size (int): Size of collector cross.
+
+        Returns:
+            pygame.Surface: Sprite surface with the cross drawn on it.
+        """
+        key = (color, collector_len, collector_size)
+        sprite = self._cross_sprites.get(key)
+        if sprite is None:
+            border_size = math.ceil(collector_size * 1.7)
+            # Leave room for the border width around the cross arms.
+            sprite_size = collector_len + 2 * border_size
+            center = sprite_size / 2
+            shift = collector_len / 2
+            sprite = pygame.Surface(
+                (sprite_size, sprite_size), flags=pygame.SRCALPHA
+            )
+            diag1_start = (center - shift, center - shift)
+            diag1_end = (center + shift, center + shift)
+            diag2_start = (center + shift, center - shift)
+            diag2_end = (center - shift, center + shift)
+            for line_color, width in (
+                (self._pg_black, border_size),
+                (self._get_pg_color(color), collector_size),
+            ):
+                pygame.draw.line(
+                    sprite, line_color, diag1_start, diag1_end, width
+                )
+                pygame.draw.line(
+                    sprite, line_color, diag2_start, diag2_end, width
+                )
+            self._cross_sprites[key] = sprite
+        return sprite
+
+    def _get_pg_color(self, color):
+        """Retrieves a memoized pygame.Color for a color tuple.
+
+        Args:
+            color (tuple): RGB color tuple.
+
+        Returns:
+            pygame.Color: Parsed color object.
+        """
+        pg_color = self._pg_colors.get(color)
+        if pg_color is None:
+            pg_color = pygame.Color(*color)
+            self._pg_colors[color] = pg_color
+        return pg_color
 
     def _center(self, position):
         """Returns the position centered on the node.
@@ -1154,22 +1733,68 @@ class raw_env(AECEnv):
             tuple: Centered position.
         """
         return (
-            position[0] + self.node_width / 2,
-            position[1] + self.node_height / 2,
+            position[0] + self._half_node_width,
+            position[1] + self._half_node_height,
         )
 
     def observation_space(self, agent):
         return self.observation_spaces[agent]
 
+    def observation_space_by_idx(self, idx):
+        """Retrieves observation space by integer agent id.
+
+        Skips the agent-name dict lookup for callers that already hold
+        the index from agent_name_mapping.
+
+        Args:
+            idx (int): Integer agent id.
+
+        Returns:
+            gymnasium.spaces.Space: Observation space of the agent.
+        """
+        return self._obs_spaces_by_idx[idx]
+
     def action_space(self, agent):
         return self.action_spaces[agent]
 
+    def action_space_by_idx(self, idx):
+        """Retrieves action space by integer agent id.
+
+        Skips the agent-name dict lookup for callers that already hold
+        the index from agent_name_mapping.
+
+        Args:
+            idx (int): Integer agent id.
+
+        Returns:
+            gymnasium.spaces.Space: Action space of the agent.
+        """
+        return self._act_spaces_by_idx[idx]
+
     def seed(self, seed=None):
-        self.rng, seed = gymnasium.utils.seeding.np_random(seed)
+        # Only construct a new generator when explicitly re-seeded; calling
+        # seed(None) repeatedly would otherwise discard the existing rng
+        # along with the entropy pool it was seeded from.
+        if seed is not None or not hasattr(self, "rng"):
+            self.rng, seed = gymnasium.utils.seeding.np_random(seed)
         return [seed]
 
     def close(self):
         if self.screen is not None:
             pygame.display.quit()
+            self.screen = None
             self.isopen = False
             pygame.quit()
+        # Drop cached surfaces and render caches so the memory is
+        # reclaimed immediately when many environments are created and
+        # destroyed; rendering recreates them lazily if needed.
+        self.surf = None
+        self.cached_obstacle_surf = None
+        self.cached_background_surf = None
+        self._paths_layer = None
+        self._paths_drawn = None
+        self._rgb_out = None
+        self._point_sprites = {}
+        self._cross_sprites = {}
+        self._text_cache = {}
+        self._font = None
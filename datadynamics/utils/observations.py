@@ -0,0 +1,45 @@
+class LazyImageDict(dict):
+    """Observation dict that renders its `image` entry lazily.
+
+    Rendering the environment image is by far the most expensive part of
+    building an observation, and many consumers (e.g. training loops using
+    only the vector entries) never read it. The `image` entry therefore
+    starts out as None and is only rendered once it is actually accessed,
+    after which the result is cached in the dict.
+
+    Note:
+        Only key-based access (`obs["image"]`, `obs.get("image")`) triggers
+        rendering; iteration via `items()` or `values()` exposes the None
+        placeholder until the image has been accessed. Pickling materializes
+        the image and yields a plain dict.
+    """
+
+    def __init__(self, entries, render_fn):
+        """Initialize lazy observation dict.
+
+        Args:
+            entries (dict): Eagerly computed observation entries, excluding
+                `image`.
+            render_fn (function): Function taking no arguments that returns
+                the rendered image. Called on first access of `image`.
+        """
+        super().__init__(entries)
+        super().__setitem__("image", None)
+        self._render_fn = render_fn
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if value is None and key == "image":
+            value = self._render_fn()
+            super().__setitem__("image", value)
+        return value
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def __reduce__(self):
+        # The render function closes over the environment and cannot be
+        # pickled; materialize the image and serialize as a plain dict.
+        return (dict, ({key: self[key] for key in self},))
@@ -50,3 +50,57 @@ def test_graph_collector(
         observation, reward, termination, truncation, info = env.last()
         action = policy.action(observation, agent)
         env.step(action)
+
+
+def _small_env():
+    graph = nx.from_numpy_array(
+        np.array(
+            [
+                [0, 1, 1, 0],
+                [1, 0, 0, 1],
+                [1, 0, 0, 1],
+                [0, 1, 1, 0],
+            ]
+        )
+    )
+    return graph_collector_v0.env(
+        graph=graph,
+        point_labels=[3],
+        init_agent_labels=[0, 1],
+        max_collect=[1, 1],
+        render_mode="rgb_array",
+    )
+
+
+def test_render_batch():
+    envs = [_small_env() for _ in range(3)]
+    for i, env in enumerate(envs):
+        env.reset(seed=0)
+        # Move the first agent differently per env so the frames are
+        # distinguishable and tile placement is actually verified.
+        if i > 0:
+            env.step(i)
+    batch_frame = envs[0].render_batch(envs, tile_cols=2)
+    height, width, _ = envs[0].render().shape
+    assert batch_frame.shape == (2 * height, 2 * width, 3)
+    # Tiles are laid out row-major; the unused tile stays black.
+    assert np.array_equal(batch_frame[:height, :width], envs[0].render())
+    assert np.array_equal(
+        batch_frame[:height, width:], envs[1].render()
+    )
+    assert np.array_equal(
+        batch_frame[height:, :width], envs[2].render()
+    )
+    assert not batch_frame[height:, width:].any()
+    for env in envs:
+        env.close()
+
+
+def test_spaces_by_idx():
+    env = _small_env()
+    for i, agent in enumerate(env.agents):
+        assert env.observation_space_by_idx(i) is env.observation_space(
+            agent
+        )
+        assert env.action_space_by_idx(i) is env.action_space(agent)
+    env.close()
@@ -0,0 +1,56 @@
+import pickle
+
+import networkx as nx
+import numpy as np
+
+from datadynamics.environments import collector_v0, graph_collector_v0
+
+
+def _collector_env():
+    return collector_v0.env(
+        point_positions=np.array([[0, 0], [1, 1]]),
+        init_agent_positions=np.array([[0.5, 0.5]]),
+        max_collect=[2],
+        render_mode="rgb_array",
+    )
+
+
+def _graph_collector_env():
+    graph = nx.from_numpy_array(
+        np.array(
+            [
+                [0, 1, 1, 0],
+                [1, 0, 0, 1],
+                [1, 0, 0, 1],
+                [0, 1, 1, 0],
+            ]
+        )
+    )
+    return graph_collector_v0.env(
+        graph=graph,
+        point_labels=[3],
+        init_agent_labels=[0],
+        max_collect=[1],
+        render_mode="rgb_array",
+    )
+
+
+def test_lazy_image_matches_render():
+    env = _collector_env()
+    env.reset(seed=0)
+    obs = env.observe("agent_0")
+    # Copy since the env reuses its output buffer across renders.
+    image = np.array(obs["image"])
+    assert np.array_equal(image, env._render(render_mode="rgb_array"))
+    env.close()
+
+
+def test_observation_is_picklable():
+    for env in (_collector_env(), _graph_collector_env()):
+        env.reset(seed=0)
+        obs = env.observe("agent_0")
+        restored = pickle.loads(pickle.dumps(obs))
+        assert isinstance(restored, dict)
+        assert restored["image"] is not None
+        assert np.array_equal(restored["image"], obs["image"])
+        env.close()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from datadynamics.environments import collector_v0
+
+
+@pytest.mark.parametrize(
+    ("point_positions, init_agent_positions, max_collect, actions"),
+    [
+        (
+            np.array([[i, i % 3] for i in range(10)]),
+            np.array([[0, 0]]),
+            [10],
+            # Includes a repeated point to cover the cheating penalty.
+            [0, 5, 2, 2, 9, 1],
+        )
+    ],
+)
+def test_cached_reward_parity(
+    point_positions,
+    init_agent_positions,
+    max_collect,
+    actions,
+):
+    env_cached = collector_v0.env(
+        point_positions=point_positions,
+        init_agent_positions=init_agent_positions,
+        max_collect=max_collect,
+        cache_distances=True,
+    )
+    env_direct = collector_v0.env(
+        point_positions=point_positions,
+        init_agent_positions=init_agent_positions,
+        max_collect=max_collect,
+        cache_distances=False,
+    )
+    env_cached.reset(seed=0)
+    env_direct.reset(seed=0)
+    for action in actions:
+        env_cached.step(action)
+        env_direct.step(action)
+        for agent in env_cached.agents:
+            assert env_cached.rewards[agent] == pytest.approx(
+                env_direct.rewards[agent]
+            )
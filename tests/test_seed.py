@@ -15,3 +15,28 @@ def test_seed():
         )
 
     seed_test(env_constructor, num_cycles=10, test_kept_state=False)
+
+
+def _env():
+    return collector_v0.env(
+        point_positions=np.array([[0, 0], [1, 1]]),
+        init_agent_positions=np.array([[0.5, 0.5]]),
+        max_collect=[2],
+    )
+
+
+def test_seed_none_preserves_rng():
+    env = _env()
+    env.seed(42)
+    rng = env.rng
+    env.seed(None)
+    assert env.rng is rng
+
+
+def test_reseed_reproduces_stream():
+    env = _env()
+    env.seed(123)
+    first = env.rng.integers(0, 1000, size=10)
+    env.seed(123)
+    second = env.rng.integers(0, 1000, size=10)
+    assert np.array_equal(first, second)